@@ -1,5 +1,6 @@
 import copy
 import logging
+import mmap
 import re
 import zlib
 from ast import literal_eval
@@ -132,8 +133,10 @@ class BaseBND:
                     self.unpack(bnd_dcx.data)
                     self.dcx = bnd_dcx.magic
                 else:
-                    with open(bnd_path, "rb") as file:
-                        self.unpack(file)
+                    # Memory-map the file so entry reads are served straight from the page cache. The map is closed
+                    # once unpacked (entry data is copied out), so the BND file can still be overwritten by `write()`.
+                    with open(bnd_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self.unpack(mm)
         elif bnd_source is not None:
             self.unpack(bnd_source)
 
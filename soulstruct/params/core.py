@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import copy
+import functools
 import io
 import logging
 import struct
+import types
 import typing as tp
-from collections import OrderedDict
 
 from soulstruct.bnd import BNDEntry
 from soulstruct.core import SoulstructError
-from soulstruct.params import enums
 from soulstruct.params.paramdef import ParamDefBND
-from soulstruct.utilities.core import BinaryStruct, read_chars_from_buffer
+from soulstruct.utilities.core import BinaryStruct, read_chars_from_bytes
 
 if tp.TYPE_CHECKING:
     from soulstruct.params.paramdef import ParamDef, ParamDefField
@@ -22,21 +22,22 @@ if tp.TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-_PARAMDEF_BND_PTD = None
-_PARAMDEF_BND_DSR = None
+
+@functools.lru_cache(maxsize=None)
+def _load_paramdef_bnd(game_version: str) -> ParamDefBND:
+    return ParamDefBND(game_version)
 
 
 def PARAMDEF_BND(game_version):
-    global _PARAMDEF_BND_PTD, _PARAMDEF_BND_DSR
-    if game_version.lower() == "ptde":
-        if _PARAMDEF_BND_PTD is None:
-            _PARAMDEF_BND_PTD = ParamDefBND("ptde")
-        return _PARAMDEF_BND_PTD
-    elif game_version.lower() == "dsr":
-        if _PARAMDEF_BND_DSR is None:
-            _PARAMDEF_BND_DSR = ParamDefBND("dsr")
-        return _PARAMDEF_BND_DSR
-    raise ValueError(f"Could not find bundled ParamDef for game version {repr(game_version)}.")
+    """Get the bundled `ParamDefBND` for "ptde" or "dsr", loading it only on first use.
+
+    The same instance is shared by every GameParam and DrawParam structure for the rest of the session, so it must be
+    treated as read-only.
+    """
+    game_version = game_version.lower()
+    if game_version not in {"ptde", "dsr"}:
+        raise ValueError(f"Could not find bundled ParamDef for game version {repr(game_version)}.")
+    return _load_paramdef_bnd(game_version)
 
 
 JUNK_ENTRY_NAMES = (b"\x80\x1e", b"\xfe\x1e")  # These appear in LIGHT_BANK in DS1.
@@ -93,66 +94,132 @@ class BitField:
 
 
 class ParamEntry:
+
+    __slots__ = ("_fields", "paramdef", "_name", "_dirty", "_packed_name", "_packed_data")
+
     def __init__(self, entry_source, paramdef, name=None):
-        self.fields = OrderedDict()
+        self._fields = {}
         self.paramdef = paramdef  # type: ParamDef
-        self.bit_field = BitField()
+        self._name = ""
+        self._dirty = True  # cleared if unpacked from binary data
+        self._packed_name = None  # type: tp.Optional[bytes]  # cached until name changes
+        self._packed_data = None  # type: tp.Optional[bytes]  # cached until any field changes
 
-        if isinstance(entry_source, OrderedDict):
+        if isinstance(entry_source, dict):
             if name is None:
                 if "name" not in entry_source:
                     raise ValueError("Name must be specified in arguments or source dictionary.")
-                self.name = entry_source["name"]
-            elif isinstance(name, str):
-                # TODO: Name needs to be converted to shift-jis?
-                if "name" not in entry_source:
-                    _LOGGER.warning(
-                        f"Name in source dictionary of ParamEntry '{entry_source['name']}' will be overridden with "
-                        f"argument value ('{name}')."
-                    )
-                self.name = entry_source["name"] = name
-            else:
+                name = entry_source["name"]
+            elif not isinstance(name, str):
                 raise ValueError("Name must be a string.")
-        elif isinstance(entry_source, dict):
-            raise TypeError("You must use an OrderedDict to create a ParamEntry. Try copying an existing entry first.")
+            elif "name" in entry_source:
+                # TODO: Name needs to be converted to shift-jis?
+                _LOGGER.warning(
+                    f"Name in source dictionary of ParamEntry '{entry_source['name']}' will be overridden with "
+                    f"argument value ('{name}')."
+                )
+            field_names = paramdef.field_names
+            if len(entry_source) - ("name" in entry_source) != len(field_names) or not all(
+                field_name in entry_source for field_name in field_names
+            ):
+                missing_fields = [field_name for field_name in field_names if field_name not in entry_source]
+                unknown_fields = [key for key in entry_source if key != "name" and key not in field_names]
+                raise ValueError(
+                    f"Dictionary for new entry of {paramdef.param_name} must contain exactly the ParamDef's fields.\n"
+                    f"    Missing fields: {missing_fields}\n"
+                    f"    Unknown fields: {unknown_fields}"
+                )
+            self.name = name
+            self._fields = {field_name: entry_source[field_name] for field_name in field_names}  # ParamDef order
         elif isinstance(entry_source, bytes):
             if name is None:
                 raise ValueError("`name` argument must be given explictly alongside raw entry data.")
             self.name = name
             self.unpack(entry_source, name)
+            self._dirty = False
+        elif isinstance(entry_source, tuple):
+            # Values already unpacked with `paramdef.entry_struct` (see `ParamTable.unpack`).
+            if name is None:
+                raise ValueError("`name` argument must be given explictly alongside unpacked entry values.")
+            self.name = name
+            self.unpack_values(entry_source)
+            self._dirty = False
 
     def __iter__(self):
-        return iter(self.fields.items())
+        return iter(self._fields.items())
 
     def __getitem__(self, field):
         if isinstance(field, int):
             try:
-                field = list(self.fields.keys())[field]
+                field = self.paramdef.field_names[field]
             except IndexError:
                 raise KeyError(f"No field with index {field}.")
         if isinstance(field, str):
             try:
-                return self.fields[field]
+                return self._fields[field]
             except KeyError:
                 raise KeyError(f"No field with name '{field}' in entry {self.name}.")
 
     def __setitem__(self, field, value):
         if isinstance(field, int):
             try:
-                field = list(self.fields.keys())[field]
+                field = self.paramdef.field_names[field]
             except IndexError:
                 raise KeyError(f"No field with index {field}. (You cannot create new fields.)")
-        if field not in self.fields:
+        if field not in self._fields:
             raise KeyError(f"Field '{field}' does not exist in params.")
         # TODO: Check value type is valid (or that it can be cast).
-        self.fields[field] = value
+        self._fields[field] = value
+        self._dirty = True
+        self._packed_data = None
+
+    @property
+    def fields(self) -> tp.Mapping[str, tp.Any]:
+        """Read-only view of all field values. Set them with `entry[field] = value`, so the entry is repacked."""
+        return types.MappingProxyType(self._fields)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._dirty = True
+        self._packed_name = None
+
+    @property
+    def dirty(self):
+        """True if the name or any field has been set since this entry was unpacked (or its table was last packed).
+
+        Changes are made through `entry[field] = value` and `entry.name = name` (`entry.fields` is read-only).
+        """
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value: bool):
+        self._dirty = value
+        if value:
+            self._packed_data = None  # repacked on next `pack()`
+
+    def __getstate__(self):
+        return {"fields": self._fields, "paramdef": self.paramdef, "_name": self._name, "_dirty": self._dirty}
+
+    def __setstate__(self, state):
+        """Also restores the `__dict__` of entries pickled before `__slots__` was used."""
+        self._fields = state["fields"]
+        self.paramdef = state["paramdef"]
+        self._name = state["_name"] if "_name" in state else state["name"]  # `name` was not always a property
+        self._dirty = state.get("_dirty", True)  # pickled before modification tracking
+        self._packed_name = None
+        self._packed_data = None
 
     @property
     def field_names(self):
         if self.paramdef.param_info:
             return [field.name for field in self.paramdef.param_info["fields"]]
         else:
-            return list(self.fields.keys())
+            return list(self._fields.keys())
 
     def get_paramdef_field(self, field_name: str) -> ParamDefField:
         return self.paramdef[field_name]
@@ -161,101 +228,118 @@ class ParamEntry:
         return self.paramdef[field_name].get_display_info(self)
 
     def __repr__(self):
-        return f"\nName: {self.name}" + "".join([f"\n    {key} = {value}" for key, value in self.fields.items()])
+        return f"\nName: {self.name}" + "".join([f"\n    {key} = {value}" for key, value in self._fields.items()])
 
     def copy(self):
-        return copy.deepcopy(self)
+        """Copy name and field values (which are all immutable). The `ParamDef` is shared, not copied."""
+        return self.__class__({"name": self.name, **self._fields}, self.paramdef)
+
+    def unpack(self, entry_data, name: str):
+        entry_struct = self.paramdef.entry_struct
+        if not isinstance(entry_data, bytes):
+            entry_data = entry_data.read(entry_struct.size)
+        if len(entry_data) < entry_struct.size:
+            # Missing fields are checked below.
+            values = entry_struct.unpack(entry_data + b"\0" * (entry_struct.size - len(entry_data)))
+        else:
+            values = entry_struct.unpack_from(entry_data)
 
-    def unpack(self, entry_buffer, name: str):
-        if isinstance(entry_buffer, bytes):
-            entry_buffer = io.BytesIO(entry_buffer)
+        self.unpack_values(values)
 
-        for field in self.paramdef.fields:
+        if len(entry_data) < entry_struct.size:
+            for field, field_type, _, _, _, end_offset in self.paramdef.entry_layout:
+                if end_offset <= len(entry_data):
+                    continue
+                if field.debug_name in {"inverseToneMapMul", "sfxMultiplier"}:
+                    # These fields are screwed up in m99 and default ToneMapBank.
+                    self._fields[field.name] = 1.0
+                else:
+                    raise ValueError(
+                        f"Could not unpack data for field {field}: entry data ends after {len(entry_data)} bytes.\n"
+                        f"Field type: {field_type}; Raw bytes: {entry_data}"
+                    )
 
-            if field.bit_size < 8:
-                field_value = self.bit_field.unpack(entry_buffer, field.bit_size)
-            elif field.internal_type == "dummy8":
-                self.bit_field.clear()
-                field_value = entry_buffer.read(field.size)
-                if not field_value == b"\0" * field.size:
+        self.name = name
+
+    def unpack_values(self, values: tuple):
+        """Set all fields from a tuple of values unpacked with `paramdef.entry_struct`."""
+        fields = self.paramdef.entry_unpacker(values)
+        if fields is None:
+            for field, field_type, value_index, bit_offset, *_ in self.paramdef.entry_layout:
+                if field_type is None and bit_offset is None and any(values[value_index]):
                     raise ValueError(
                         f"Pad value of field {field} in entry {self.name} of ParamTable "
-                        f"{self.paramdef.param_name} is not null: {field_value}."
+                        f"{self.paramdef.param_name} is not null: {values[value_index]}."
                     )
+        self._fields = fields
+        self._packed_data = None
+
+    def pack_name(self) -> bytes:
+        """Get the null-terminated shift-JIS name. Cached until the name is set again."""
+        if self._packed_name is None:
+            if self._name in JUNK_ENTRY_NAMES:
+                self._packed_name = self._name + b"\0"  # never decoded
             else:
-                self.bit_field.clear()
-                try:
-                    field_type = getattr(enums, field.internal_type)
-                except AttributeError:
-                    if field.name == "sfxMultiplier":
-                        field_type = enums.f32
-                    else:
-                        raise KeyError(
-                            f"Field {field.name} in ParamTable {self.paramdef.param_name} has unknown "
-                            f"internal type {field.internal_type} (debug type = {field.debug_type})."
-                        )
-                data = entry_buffer.read(field_type.size())
-                try:
-                    (field_value,) = struct.unpack(field_type.format(), data)
-                except struct.error as e:
-                    if field.debug_name in {"inverseToneMapMul", "sfxMultiplier"}:
-                        # These fields are screwed up in m99 and default ToneMapBank.
-                        field_value = 1.0
-                    else:
-                        print(data, field_type)
-                        raise ValueError(
-                            f"Could not unpack data for field {field}.\n"
-                            f"Field type: {field_type}; Raw bytes: {data}\n"
-                            f"Error:\n{str(e)}"
-                        )
-
-            self.fields[field.name] = field_value
-
-        self.name = name
+                self._packed_name = self._name.encode("shift_jis_2004") + b"\0"
+        return self._packed_name
 
     def pack(self):
-        packed_entry = b""
-        for field_name, field_value in self.fields.items():  # These are ordered correctly already.
-            field = self.paramdef[field_name]
-            if field.bit_size < 8:
+        """Pack all fields. Cached until a field is set again (or `dirty` is set to True)."""
+        if self._packed_data is None:
+            self._packed_data = self.paramdef.entry_packer(self._fields)
+            if self._packed_data is None:
+                # Some field value is invalid. Pack field by field to find it.
+                self._packed_data = self._pack_field_by_field()
+        return self._packed_data
+
+    def _pack_field_by_field(self):
+        values = []
+        for field, field_type, value_index, bit_offset, bit_mask, _ in self.paramdef.entry_layout:
+            field_value = self._fields[field.name]
+            if bit_offset is not None:
                 # Add bits.
-                completed_byte = self.bit_field.pack(field_value, field.bit_size)
-                if completed_byte is not None:
-                    packed_entry += struct.pack("<B", completed_byte)
+                if field_value & ~bit_mask:
+                    raise ValueError(
+                        f"Value {field_value} of binary field {field.name} is larger than given bit count "
+                        f"({field.bit_size})."
+                    )
+                if value_index == len(values):
+                    values.append(field_value << bit_offset)
+                else:
+                    values[value_index] |= field_value << bit_offset
                 continue
-            completed_byte = self.bit_field.pad()
-            if completed_byte is not None:
-                packed_entry += struct.pack("<B", completed_byte)
-            if field.internal_type == "dummy8":
-                # Write nulls.
-                packed_entry += b"\x00" * field.size
+            if field_type is None:
+                values.append(b"")  # padded with nulls
                 continue
-            try:
-                field_type = getattr(enums, field.internal_type)
-            except AttributeError:
-                if field.name == "sfxMultiplier":
-                    field_type = enums.f32
-                else:
-                    raise ParamError(
-                        f"Field {field.name} in ParamTable {self.paramdef.param_name} has unknown "
-                        f"internal type {field.internal_type} (debug type = {field.debug_type})."
-                    )
-            if not isinstance(self[field.name], field_type.python_type()):
-                raise ParamError(
-                    f"Bad type: field {field.name} in entry {repr(self.name)} of table "
-                    f"{self.paramdef.param_name} has value {self[field.name]} with type "
-                    f"{type(self[field.name])}, but should have type {field_type.python_type()}."
-                )
-            if not field_type.minimum() <= self[field.name] <= field_type.maximum():
-                _LOGGER.error(f"Error in field. Field data: {field}")
-                raise ParamError(
-                    f"Invalid: field {field.name} in entry {repr(self.name)} of table "
-                    f"{self.paramdef.param_name} has out-of-range value {self[field.name]} "
-                    f"(range is {field_type.minimum()} to {field_type.maximum()})."
-                )
-            packed_entry += struct.pack(field_type.format(), field_value)
-
-        return packed_entry
+            if field.python_type is float:
+                # `struct` would accept ints (and NaN) for these, so they are still checked here.
+                self._check_field_value(field, field_value)
+            values.append(field_value)
+
+        try:
+            return self.paramdef.entry_struct.pack(*values)
+        except struct.error:
+            # Integer fields are type- and range-checked by `struct` in one go. Find the bad field for a better error.
+            for field, field_type, *_ in self.paramdef.entry_layout:
+                if field_type is not None:
+                    self._check_field_value(field, self._fields[field.name])
+            raise
+
+    def _check_field_value(self, field: ParamDefField, field_value):
+        if not isinstance(field_value, field.python_type):
+            raise ParamError(
+                f"Bad type: field {field.name} in entry {repr(self.name)} of table "
+                f"{self.paramdef.param_name} has value {field_value} with type "
+                f"{type(field_value)}, but should have type {field.python_type}."
+            )
+        minimum, maximum = field.value_range
+        if not minimum <= field_value <= maximum:
+            _LOGGER.error(f"Error in field. Field data: {field}")
+            raise ParamError(
+                f"Invalid: field {field.name} in entry {repr(self.name)} of table "
+                f"{self.paramdef.param_name} has out-of-range value {field_value} "
+                f"(range is {minimum} to {maximum})."
+            )
 
 
 class ParamTable:
@@ -279,6 +363,20 @@ class ParamTable:
         ("data_offset", "i"),
         ("name_offset", "i"),
     )
+    ENTRY_POINTER_PACKER = struct.Struct("<iii")  # same layout as `ENTRY_POINTER_STRUCT`, without dictionaries
+
+    __slots__ = (
+        "param_path",
+        "param_name",
+        "_paramdef_bnd",
+        "entries",
+        "__magic",
+        "__unknown",
+        "_nickname",
+        "_dirty",
+        "_sorted_ids",
+        "_sorted_id_set",
+    )
 
     entries: tp.Dict[int, ParamEntry]
 
@@ -290,20 +388,26 @@ class ParamTable:
         self.__magic = []
         self.__unknown = None
         self._nickname = ""
+        self._dirty = True  # cleared if unpacked from binary data
+        self._sorted_ids = None  # type: tp.Optional[tp.List[int]]  # rebuilt whenever the set of entry IDs changes
+        self._sorted_id_set = None  # type: tp.Optional[tp.Set[int]]
 
         if isinstance(param_source, dict):
             self.entries = param_source
 
         elif isinstance(param_source, bytes):
             self.unpack(io.BytesIO(param_source))
+            self._dirty = False
 
         elif isinstance(param_source, str):
             self.param_path = param_source
             with open(param_source, "rb") as data:
                 self.unpack(data)
+            self._dirty = False
 
         elif isinstance(param_source, BNDEntry):
             self.unpack(io.BytesIO(param_source.data))
+            self._dirty = False
 
         else:
             raise TypeError(f"Invalid `param_source` type: {type(param_source)}")
@@ -320,6 +424,7 @@ class ParamTable:
             entry = ParamEntry(entry, self._paramdef_bnd[self.param_name])
         if isinstance(entry, ParamEntry):
             self.entries[entry_index] = entry
+            self._dirty = True
         else:
             raise TypeError("New entry must be a ParamEntry or a dictionary that contains all required fields.")
 
@@ -339,7 +444,43 @@ class ParamTable:
         return len(self.entries)
 
     def pop(self, entry_id):
-        return self.entries.pop(entry_id)
+        entry = self.entries.pop(entry_id)
+        self._dirty = True
+        return entry
+
+    @property
+    def dirty(self):
+        """True if this table may differ from the binary data it was unpacked from (or was last packed into a BND as).
+
+        Entries added with `table[entry_id] = entry`, removed with `pop()`, or edited (see `ParamEntry.dirty`) all
+        count. Setting this to False also clears the flag of every entry.
+        """
+        return self._dirty or any(entry.dirty for entry in self.entries.values())
+
+    @dirty.setter
+    def dirty(self, value: bool):
+        self._dirty = value
+        if not value:
+            for entry in self.entries.values():
+                entry.dirty = False
+
+    def __getstate__(self):
+        return {
+            "param_path": self.param_path,
+            "param_name": self.param_name,
+            "_paramdef_bnd": self._paramdef_bnd,
+            "entries": self.entries,
+            "_ParamTable__magic": self.__magic,  # keys match the `__dict__` of tables pickled before `__slots__`
+            "_ParamTable__unknown": self.__unknown,
+            "_nickname": self._nickname,
+            "_dirty": self._dirty,
+        }
+
+    def __setstate__(self, state):
+        self._dirty = True  # pickled before modification tracking
+        self._sorted_ids = self._sorted_id_set = None
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @property
     def paramdef(self):
@@ -371,9 +512,17 @@ class ParamTable:
         # Entry data offset in header not used. (It's an unsigned short, yet doesn't limit entry count to 5461.)
         name_data_offset = header["name_data_offset"]  # CANNOT BE TRUSTED IN VANILLA FILES! Off by +12 bytes.
 
-        # Load entry pointer data.
-        entry_pointers = self.ENTRY_POINTER_STRUCT.unpack_count(param_buffer, count=header["entry_count"])
-        entry_data_offset = param_buffer.tell()  # Reliable entry data offset.
+        # Everything else is unpacked from offsets into the full data, without copying.
+        entry_pointer_table_offset = param_buffer.tell()
+        param_buffer.seek(0)
+        param_data = param_buffer.read()
+        param_view = memoryview(param_data)
+
+        # Load entry pointer data: `(entry_id, data_offset, name_offset)` tuples.
+        entry_data_offset = entry_pointer_table_offset + self.ENTRY_POINTER_PACKER.size * header["entry_count"]
+        entry_pointers = list(
+            self.ENTRY_POINTER_PACKER.iter_unpack(param_view[entry_pointer_table_offset:entry_data_offset])
+        )
 
         # Entry size is lazily determined. TODO: Unpack entry data in sequence and associate with names separately.
         if len(entry_pointers) == 0:
@@ -387,33 +536,71 @@ class ParamTable:
             else:
                 entry_size = name_data_offset - entry_data_offset
         else:
-            entry_size = entry_pointers[1]["data_offset"] - entry_pointers[0]["data_offset"]
+            entry_size = entry_pointers[1][1] - entry_pointers[0][1]
+
+        entry_struct = self.paramdef.entry_struct
+        first_data_offset = entry_pointers[0][1]
+        if entry_size == entry_struct.size and all(
+            data_offset == first_data_offset + i * entry_size for i, (_, data_offset, _) in enumerate(entry_pointers)
+        ):
+            # Entries are contiguous and complete (as in all vanilla params), so they can all be unpacked in one call.
+            entry_values = entry_struct.iter_unpack(
+                param_view[first_data_offset : first_data_offset + entry_size * len(entry_pointers)]
+            )
+        else:
+            entry_values = None
 
-        # Note that we no longer need to track buffer offset.
-        for entry_struct in entry_pointers:
-            param_buffer.seek(entry_struct["data_offset"])
-            entry_data = param_buffer.read(entry_size)
-            if entry_struct["name_offset"] != 0:
-                try:
-                    name = read_chars_from_buffer(
-                        param_buffer,
-                        offset=entry_struct["name_offset"],
-                        encoding="shift_jis_2004",
-                        reset_old_offset=False,  # no need to reset
-                        ignore_encoding_error_for_these_chars=JUNK_ENTRY_NAMES,
-                    )
-                except ValueError:
-                    param_buffer.seek(entry_struct["name_offset"])
-                    _LOGGER.error(
-                        f"Could not find null termination for entry name string in {self.param_name}.\n"
-                        f"    Header: {header}\n"
-                        f"    Entry Struct: {entry_struct}\n"
-                        f"    30 chrs of name data: {param_buffer.read(30)}"
-                    )
-                    raise
+        entry_names = self._unpack_entry_names(param_data, entry_pointers, header)
+
+        for (entry_id, data_offset, _), name in zip(entry_pointers, entry_names):
+            if entry_values is not None:
+                entry_data = next(entry_values)
+            elif entry_size >= entry_struct.size:
+                entry_data = entry_struct.unpack_from(param_view, data_offset)
             else:
-                name = ""
-            self.entries[entry_struct["id"]] = ParamEntry(entry_data, self.paramdef, name=name)
+                entry_data = param_data[data_offset : data_offset + entry_size]  # checked by `ParamEntry.unpack()`
+            self.entries[entry_id] = ParamEntry(entry_data, self.paramdef, name=name)
+
+    def _unpack_entry_names(self, param_data: bytes, entry_pointers, header):
+        """Split all null-terminated entry names (which follow the entry data) at once and decode each name once."""
+        name_offsets = [name_offset for _, _, name_offset in entry_pointers]
+        names = {0: ""}
+        raw_names = {}
+        if any(name_offsets):
+            names_start = min(offset for offset in name_offsets if offset != 0)
+            offset = names_start
+            for raw_name in param_data[names_start:].split(b"\0")[:-1]:  # last item is not null-terminated
+                raw_names[offset] = raw_name
+                offset += len(raw_name) + 1
+        for entry_pointer, name_offset in zip(entry_pointers, name_offsets):
+            if name_offset in names:
+                continue
+            if name_offset in raw_names:
+                raw_name = raw_names[name_offset]
+                try:
+                    names[name_offset] = raw_name.decode("shift_jis_2004")
+                except UnicodeDecodeError:
+                    if raw_name not in JUNK_ENTRY_NAMES:
+                        raise
+                    names[name_offset] = raw_name  # never decoded
+                continue
+            # Name does not start right after another name (or is not null-terminated).
+            try:
+                names[name_offset] = read_chars_from_bytes(
+                    param_data,
+                    offset=name_offset,
+                    encoding="shift_jis_2004",
+                    ignore_encoding_error_for_these_chars=JUNK_ENTRY_NAMES,
+                )
+            except ValueError:
+                _LOGGER.error(
+                    f"Could not find null termination for entry name string in {self.param_name}.\n"
+                    f"    Header: {header}\n"
+                    f"    Entry Pointer: {entry_pointer}\n"
+                    f"    30 chrs of name data: {param_data[name_offset:name_offset + 30]}"
+                )
+                raise
+        return [names[name_offset] for name_offset in name_offsets]
 
     def pack(self, sort=True):
         # if len(self.entries) > 5461:
@@ -421,45 +608,46 @@ class ParamTable:
         #         f"ParamTable {self.param_name} has {len(self.entries)} entries, which is more than a "
         #         f"DS1 Param can store (5461). Remove some entries before packing it.")
 
-        sorted_entries = sorted(self.entries.items()) if sort else self.entries.items()
+        if sort and not self._entries_in_order():
+            sorted_entries = sorted(self.entries.items())  # entry IDs are unique, so entries are never compared
+        else:  # already sorted (usual after `unpack`)
+            sorted_entries = self.entries.items()
 
         current_name_offset = 0
         name_offset_list = []
         data_offset = 0
         data_offset_list = []
-        packed_names = b""
-        packed_data = b""
+        packed_names = []
+        packed_data = []
 
         for entry_id, entry in sorted_entries:
 
             # Pack names with relative offsets (to be globally offset later).
-            if entry.name in JUNK_ENTRY_NAMES:
-                name_z_str = entry.name + b"\0"  # never decoded
-            else:
-                name_z_str = entry.name.encode("shift_jis_2004") + b"\0"
-            packed_names += name_z_str
+            name_z_str = entry.pack_name()
+            packed_names.append(name_z_str)
             name_offset_list.append(current_name_offset)
             current_name_offset += len(name_z_str)
 
             # Pack entry data.
             packed_entry = entry.pack()
-            packed_data += packed_entry
+            packed_data.append(packed_entry)
             data_offset_list.append(data_offset)
             data_offset += len(packed_entry)
 
         entry_pointer_table_offset = self.HEADER_STRUCT.size
         entry_data_offset = entry_pointer_table_offset + self.ENTRY_POINTER_STRUCT.size * len(sorted_entries)
-        name_data_offset = entry_data_offset + len(packed_data)
+        name_data_offset = entry_data_offset + data_offset
 
         # Entries.
-        entry_pointer_data = b""
+        pointer_struct = self.ENTRY_POINTER_PACKER
+        entry_pointer_data = bytearray(pointer_struct.size * len(sorted_entries))
         for i, (entry_id, _) in enumerate(sorted_entries):
-            entry_pointer_data += self.ENTRY_POINTER_STRUCT.pack(
-                dict(
-                    id=entry_id,
-                    data_offset=entry_data_offset + data_offset_list[i],
-                    name_offset=name_data_offset + name_offset_list[i],
-                )
+            pointer_struct.pack_into(
+                entry_pointer_data,
+                i * pointer_struct.size,
+                entry_id,
+                entry_data_offset + data_offset_list[i],
+                name_data_offset + name_offset_list[i],
             )
 
         # Header.
@@ -476,7 +664,7 @@ class ParamTable:
             )
         )
 
-        return header + entry_pointer_data + packed_data + packed_names
+        return b"".join([header, entry_pointer_data, *packed_data, *packed_names])
 
     def write_packed(self, param_path=None):
         if param_path is None:
@@ -490,14 +678,42 @@ class ParamTable:
         with open(param_path, "wb") as output:
             output.write(self.pack())
 
+    def _entries_in_order(self) -> bool:
+        """Check if entry IDs are already in ascending order, without sorting or copying them."""
+        entry_ids = iter(self.entries)
+        previous_id = next(entry_ids, None)
+        for entry_id in entry_ids:
+            if entry_id <= previous_id:
+                return False
+            previous_id = entry_id
+        return True
+
+    def get_sorted_ids(self) -> tp.List[int]:
+        """Get all entry IDs in ascending order. Cached until the set of entry IDs changes (do not modify the list).
+
+        The cache is checked against `entries` itself, so it also notices entries added or removed directly.
+        """
+        if self._sorted_ids is None or self.entries.keys() != self._sorted_id_set:
+            self._sorted_id_set = set(self.entries)
+            self._sorted_ids = sorted(self._sorted_id_set)
+        return self._sorted_ids
+
     def get_range(self, start, count):
-        return [(param_id, self[param_id]) for param_id in sorted(self.entries)[start : start + count]]
+        return [(param_id, self[param_id]) for param_id in self.get_sorted_ids()[start : start + count]]
 
     def copy(self):
-        return copy.deepcopy(self)
+        """Copy all entries (see `ParamEntry.copy()`). The `ParamDefBND` is shared, not copied."""
+        table_copy = copy.copy(self)
+        table_copy.entries = {entry_id: entry.copy() for entry_id, entry in self.entries.items()}
+        table_copy.__magic = list(self.__magic)
+        table_copy.dirty = True  # not packed into any BND yet
+        return table_copy
 
 
 class DrawParamTable(ParamTable):
+
+    __slots__ = ()
+
     def get_nonzero_entries(self, ignore_polyg=True):
         """ Filters table entries and returns only those with a non-empty name that does not start with '0' (or,
         by default, 'PolyG', which I assume is cutscene-specific lighting). """
@@ -1,12 +1,16 @@
 from __future__ import annotations
 import logging
+import os
 import pickle
 import re
+from io import BytesIO, IOBase
 from pathlib import Path
 import typing as tp
 
 from soulstruct.bnd.core import BND, BaseBND
 from soulstruct.params import ParamTable, DrawParamTable, PARAMDEF_BND
+from soulstruct.params.paramdef import ParamDef, ParamDefBND
+from soulstruct.utilities.core import find_dcx
 
 if tp.TYPE_CHECKING:
     from soulstruct.text import DarkSoulsText
@@ -15,6 +19,7 @@ __all__ = ["DarkSoulsGameParameters", "DarkSoulsLightingParameters", "DRAW_PARAM
 _LOGGER = logging.getLogger(__name__)
 
 _PARAM_FILE_NAME_RE = re.compile(r"(/[ms]\d\d)(_[\w]+\.DrawParam\.parambnd)")
+_PARAM_SUFFIX = ".param"
 
 _AMBIGUOUS_NICKNAMES = {
     "AtkParam_Npc.param": "NonPlayerAttacks",
@@ -23,7 +28,99 @@ _AMBIGUOUS_NICKNAMES = {
     "BehaviorParam_PC.param": "PlayerBehaviors",
 }
 
-class DarkSoulsGameParameters:
+# Pickled snapshots of GameParam BNDs loaded by `DarkSoulsGameParameters.load_cached()`, keyed by resolved file path and
+# stored with the file's `(st_mtime_ns, st_size)` at load time.
+_GAME_PARAM_CACHE = {}  # type: tp.Dict[Path, tp.Tuple[tp.Tuple[int, int], bytes]]
+
+
+def _get_bundled_paramdef(game_version: str, param_name: str) -> ParamDef:
+    return PARAMDEF_BND(game_version)[param_name]
+
+
+def _pickle_with_bundled_paramdefs(game_params: DarkSoulsGameParameters) -> bytes:
+    """Pickle `game_params` with references to its bundled `ParamDefBND` (and its `ParamDef`s) rather than copies.
+
+    Unpickling the result gets them from `PARAMDEF_BND()` again, so they stay shared with every other structure. This
+    uses a dispatch table rather than `persistent_id()`, which would be called for every pickled object.
+    """
+    paramdef_bnd = game_params.paramdef_bnd
+    game_version = "dsr" if paramdef_bnd.remastered else "ptde"
+    paramdef_names = {id(paramdef): param_name for param_name, paramdef in paramdef_bnd.paramdefs.items()}
+
+    def reduce_paramdef_bnd(obj: ParamDefBND):
+        if obj is paramdef_bnd:
+            return PARAMDEF_BND, (game_version,)
+        return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    def reduce_paramdef(obj: ParamDef):
+        if id(obj) in paramdef_names:
+            return _get_bundled_paramdef, (game_version, paramdef_names[id(obj)])
+        return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    pickled = BytesIO()
+    pickler = pickle.Pickler(pickled, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {ParamDefBND: reduce_paramdef_bnd, ParamDef: reduce_paramdef}
+    pickler.dump(game_params)
+    return pickled.getvalue()
+
+
+def _write_pickle(obj, pickle_path):
+    """Pickle `obj` in memory first, so the file is written in one call rather than once per pickle frame."""
+    Path(pickle_path).write_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read_pickle(cls, pickle_path):
+    with Path(pickle_path).open("rb") as f:
+        obj = pickle.load(f)
+    if not isinstance(obj, cls):
+        raise TypeError(f"Pickled file does not contain a `{cls.__name__}` instance: {pickle_path}")
+    return obj
+
+
+class _NicknameContainer:
+    """Base for the containers below, which store their contents only in `_data`.
+
+    Attributes like `Weapons`, `Fog`, or `m10` are resolved from `_data` in `__getattr__`, through the dictionary in the
+    slot named by `_NICKNAMES_SLOT` (or directly by `_data` key if that is None).
+    """
+
+    __slots__ = ()
+    _NICKNAMES_SLOT = None  # type: tp.Optional[str]
+
+    def __getattr__(self, nickname):
+        if not nickname.startswith("_"):  # private slots may not be set yet (e.g. while unpickling)
+            data_key = nickname if self._NICKNAMES_SLOT is None else getattr(self, self._NICKNAMES_SLOT).get(nickname)
+            if data_key in self._data:
+                return self._data[data_key]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{nickname}'")
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(getattr(self, self._NICKNAMES_SLOT or "_data", ()))
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setstate__(self, state: dict):
+        """Also restores the `__dict__` of an instance pickled before `__slots__` was used.
+
+        Those older instances stored every table as a nickname attribute (alongside `_data`) rather than in a nickname
+        dictionary, so that dictionary is rebuilt from them.
+        """
+        nicknames_slot = self._NICKNAMES_SLOT
+        if nicknames_slot is not None and nicknames_slot not in state:
+            data_keys = {id(value): key for key, value in state["_data"].items()}
+            state[nicknames_slot] = {
+                name: data_keys[id(value)] for name, value in state.items() if id(value) in data_keys
+            }
+        for name in self.__slots__:
+            if name in state:
+                setattr(self, name, state[name])
+
+
+class DarkSoulsGameParameters(_NicknameContainer):
+
+    __slots__ = ("_reload_warning", "_data", "_nickname_paths", "_game_param_bnd", "paramdef_bnd")
+    _NICKNAMES_SLOT = "_nickname_paths"
 
     AI: ParamTable
     Armor: ParamTable
@@ -102,6 +199,7 @@ class DarkSoulsGameParameters:
         """
         self._reload_warning = True
         self._data = {}
+        self._nickname_paths = {}  # type: tp.Dict[str, str]
 
         if game_param_bnd_source is None:
             self._game_param_bnd = None
@@ -110,32 +208,66 @@ class DarkSoulsGameParameters:
 
         if isinstance(game_param_bnd_source, BaseBND):
             self._game_param_bnd = game_param_bnd_source
-        else:
+        elif isinstance(game_param_bnd_source, (str, Path, bytes, IOBase)):
             if isinstance(game_param_bnd_source, (str, Path)):
-                game_param_bnd_source = Path(game_param_bnd_source)
-                if game_param_bnd_source.is_dir():
-                    if (game_param_bnd_source / "GameParam.parambnd").is_file():
-                        game_param_bnd_source = game_param_bnd_source / "GameParam.parambnd"
-                    elif (game_param_bnd_source / "GameParam.parambnd.dcx").is_file():
-                        game_param_bnd_source = game_param_bnd_source / "GameParam.parambnd.dcx"
-            try:
-                self._game_param_bnd = BND(game_param_bnd_source)
-            except TypeError:
-                raise TypeError("Could not load DarkSoulsGameParameters from given source.")
+                game_param_bnd_source = self._get_game_param_bnd_path(game_param_bnd_source)
+            self._game_param_bnd = BND(game_param_bnd_source)
+        else:
+            raise TypeError(
+                f"Could not load DarkSoulsGameParameters from source of type {type(game_param_bnd_source).__name__}."
+            )
         self.paramdef_bnd = PARAMDEF_BND("dsr" if self._game_param_bnd.dcx else "ptde")
 
         for entry in self._game_param_bnd:
             p = self._data[entry.path] = ParamTable(entry.data, self.paramdef_bnd)
-            if p.param_info is not None:
-                if p.nickname is None:
-                    setattr(self, _AMBIGUOUS_NICKNAMES[entry.name], p)
+            param_info = p.param_info  # resolved once, rather than again through `p.nickname`
+            if param_info is not None:
+                if param_info["nickname"] is None:
+                    self._nickname_paths[_AMBIGUOUS_NICKNAMES[entry.name]] = entry.path
                 else:
-                    setattr(self, p.nickname, p)  # shortcut attribute
+                    self._nickname_paths[param_info["nickname"]] = entry.path  # shortcut attribute (see `__getattr__`)
+        _LOGGER.debug(f"Loaded {len(self._data)} GameParam tables from {self._game_param_bnd.bnd_path}.")
+
+    @classmethod
+    def load_cached(cls, game_param_bnd_path) -> DarkSoulsGameParameters:
+        """Load GameParam from a BND file (or its directory), reusing an earlier load of the same unchanged file.
+
+        A pickled snapshot of the first load is kept for the rest of the session, and later calls unpickle a new,
+        independent instance from it rather than unpacking every ParamTable again. The bundled `ParamDefBND` is not
+        copied into the snapshot, so every instance shares it. The snapshot is discarded when the
+        file's modification time or size changes, or when any `DarkSoulsGameParameters` is saved.
+        """
+        bnd_path = cls._get_game_param_bnd_path(game_param_bnd_path)
+        if bnd_path.is_dir():
+            return cls(bnd_path)  # unpacked BND directory; no single file to check for changes
+        bnd_path = find_dcx(bnd_path).resolve()
+        stat = bnd_path.stat()
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _GAME_PARAM_CACHE.get(bnd_path)
+        if cached is not None and cached[0] == file_stamp:
+            return pickle.loads(cached[1])
+        game_params = cls(bnd_path)
+        _GAME_PARAM_CACHE[bnd_path] = (file_stamp, _pickle_with_bundled_paramdefs(game_params))
+        return game_params
+
+    @staticmethod
+    def _get_game_param_bnd_path(game_param_bnd_path) -> Path:
+        """Find 'GameParam.parambnd[.dcx]' if `game_param_bnd_path` is the directory containing it."""
+        game_param_bnd_path = Path(game_param_bnd_path)
+        if game_param_bnd_path.is_dir():
+            if (game_param_bnd_path / "GameParam.parambnd").is_file():
+                return game_param_bnd_path / "GameParam.parambnd"
+            elif (game_param_bnd_path / "GameParam.parambnd.dcx").is_file():
+                return game_param_bnd_path / "GameParam.parambnd.dcx"
+        return game_param_bnd_path
 
     def update_bnd(self):
-        """Update the internal BND by packing the current ParamTables. Called automatically by `save()`."""
+        """Update the internal BND by packing any modified ParamTables. Called automatically by `save()`."""
+        bnd_entries_by_path = self._game_param_bnd.entries_by_path  # property builds a new dictionary every time
         for param_table_entry_path, param_table in self._data.items():
-            self._game_param_bnd.entries_by_path[param_table_entry_path].data = param_table.pack()
+            if param_table.dirty:
+                bnd_entries_by_path[param_table_entry_path].data = param_table.pack()
+                param_table.dirty = False
 
     def save(self, game_param_bnd_path=None, auto_pickle=False):
         """Save the DarkSoulsGameParameters. If no path is given, it will attempt to save to the same BND file."""
@@ -145,6 +277,7 @@ class DarkSoulsGameParameters:
         if game_param_bnd_path is not None and Path(game_param_bnd_path).is_dir():
             game_param_bnd_path = Path(game_param_bnd_path) / "GameParam.parambnd"
         self._game_param_bnd.write(game_param_bnd_path)
+        _GAME_PARAM_CACHE.clear()
         _LOGGER.info("Dark Souls game parameters (GameParam) written successfully.")
         if not self._reload_warning:
             _LOGGER.info("Remember to reload your game to see changes.")
@@ -153,15 +286,20 @@ class DarkSoulsGameParameters:
     def pickle(self, game_param_pickle_path=None):
         """Save the entire DarkSoulsGameParameters to a pickled file, which will be faster to load in future."""
         if game_param_pickle_path is None:
-            game_param_pickle_path = self._game_param_bnd.bnd_path
-            if game_param_pickle_path is None:
+            # BNDs that were not loaded from a file have an empty `bnd_path` rather than None.
+            if self._game_param_bnd is None or not self._game_param_bnd.bnd_path.name:
                 raise ValueError("Could not automatically determine path to pickle DarkSoulsGameParameters.")
+            game_param_pickle_path = self._game_param_bnd.bnd_path
             while game_param_pickle_path.suffix in {".dcx", ".parambnd"}:
                 game_param_pickle_path = game_param_pickle_path.parent / game_param_pickle_path.stem
-            if not game_param_pickle_path.suffix != ".pickle":
-                game_param_pickle_path = game_param_pickle_path.with_suffix(game_param_pickle_path.suffix + ".pickle")
-        with Path(game_param_pickle_path).open("wb") as f:
-            pickle.dump(self, f)
+            if game_param_pickle_path.suffix != ".pickle":
+                game_param_pickle_path = game_param_pickle_path.with_name(game_param_pickle_path.name + ".pickle")
+        _write_pickle(self, game_param_pickle_path)
+
+    @classmethod
+    def load_pickle(cls, game_param_pickle_path) -> DarkSoulsGameParameters:
+        """Load a `DarkSoulsGameParameters` instance previously saved with `pickle()`."""
+        return _read_pickle(cls, game_param_pickle_path)
 
     def __getitem__(self, param_nickname) -> ParamTable:
         return getattr(self, param_nickname)
@@ -212,7 +350,10 @@ DRAW_PARAM_TABLES = (
 )
 
 
-class MapDrawParam:
+class MapDrawParam(_NicknameContainer):
+
+    __slots__ = ("_data", "_bnd_entry_paths", "_nickname_param_names", "_draw_param_bnd")
+    _NICKNAMES_SLOT = "_nickname_param_names"
 
     DepthOfField: tp.List[tp.Optional[DrawParamTable]]
     # EnvLightTex: List[Optional[DrawParamTable]]
@@ -231,15 +372,18 @@ class MapDrawParam:
         """Structure that manages double-slots and table nicknames for one DrawParam BND file (i.e. one map area)."""
         self._data = {}  # type: tp.Dict[str, tp.List[tp.Optional[DrawParamTable], tp.Optional[DrawParamTable]]]
         self._bnd_entry_paths = {}  # type: tp.Dict[tp.Tuple[str, int], str]
-        paramdef_bnd = PARAMDEF_BND("dsr" if bool(draw_param_bnd.dcx) else "ptde")
-
+        self._nickname_param_names = {}  # type: tp.Dict[str, str]
         if not isinstance(draw_param_bnd, BaseBND):
             draw_param_bnd = BND(draw_param_bnd)
 
         self._draw_param_bnd = draw_param_bnd
+        paramdef_bnd = PARAMDEF_BND("dsr" if draw_param_bnd.dcx else "ptde")
 
         for entry in draw_param_bnd:
-            parts = entry.name[: -len(".param")].split("_")
+            entry_name = entry.name  # `BNDEntry.name` builds a new `Path` on every access.
+            if not entry_name.endswith(_PARAM_SUFFIX):
+                raise ValueError(f"Malformed ParamTable name: '{entry_name}'")
+            parts = entry_name[: -len(_PARAM_SUFFIX)].split("_")
             if len(parts) == 2:
                 slot = 0
                 param_name = parts[1]
@@ -251,16 +395,20 @@ class MapDrawParam:
                 slot = 1
                 param_name = parts[2]
             else:
-                raise ValueError(f"Malformed ParamTable name: '{entry.name}'")
+                raise ValueError(f"Malformed ParamTable name: '{entry_name}'")
             if parts[0].startswith("s"):
                 param_name = "s_" + param_name
 
             self._data.setdefault(param_name, [None, None])[slot] = p = DrawParamTable(entry.data, paramdef_bnd)
             self._bnd_entry_paths[param_name, slot] = entry.path
-            if p.param_info is not None:
-                setattr(self, p.nickname, self._data[param_name])
+            param_info = p.param_info
+            if param_info is not None:
+                self._nickname_param_names[param_info["nickname"]] = param_name  # see `__getattr__`
 
     def __getitem__(self, category):
+        """Get table slots by nickname (e.g. 'Fog') or by the table name used in `keys()` (e.g. 'FogBank')."""
+        if category in self._data:
+            return self._data[category]
         if not category.startswith("_"):
             try:
                 return getattr(self, category)
@@ -269,7 +417,7 @@ class MapDrawParam:
         raise KeyError(f"{category} is not a valid Lighting param category.")
 
     def __iter__(self):
-        return iter(self._data.keys())
+        return iter(self._data)
 
     def keys(self):
         return self._data.keys()
@@ -311,7 +459,8 @@ class MapDrawParam:
             slots[1] = slots[0].copy()
 
     def update_bnd(self):
-        """Update the internal BND by packing the current ParamTables. Called automatically by `save()`."""
+        """Update the internal BND by packing modified ParamTables and removing deleted slots. Called by `save()`."""
+        bnd_entries_by_path = self._draw_param_bnd.entries_by_path
         for param_name, param_table_slots in self._data.items():
             for slot, param_table in enumerate(param_table_slots):
                 try:
@@ -320,8 +469,9 @@ class MapDrawParam:
                     continue  # Slot does not exist.
                 if param_table is None:
                     self._draw_param_bnd.remove_entry(param_table_entry_path)  # Slot deleted.
-                else:
-                    self._draw_param_bnd.entries_by_path[param_table_entry_path].data = param_table.pack()
+                elif param_table.dirty:
+                    bnd_entries_by_path[param_table_entry_path].data = param_table.pack()
+                    param_table.dirty = False
 
     def save(self, draw_param_bnd_path=None):
         """Save the DarkSoulsGameParameters. If no path is given, it will attempt to save to the same BND file."""
@@ -343,7 +493,9 @@ DRAW_PARAM_MAPS = {
 }
 
 
-class DarkSoulsLightingParameters:
+class DarkSoulsLightingParameters(_NicknameContainer):
+
+    __slots__ = ("_reload_warning_given", "_data", "_bnd_file_names", "_draw_param_directory")
 
     _MAP_IDS = (10, 11, 12, 13, 14, 15, 16, 17, 18, 99, "default")
 
@@ -393,6 +545,9 @@ class DarkSoulsLightingParameters:
 
         self._draw_param_directory = Path(draw_param_directory)
 
+        # List the directory once rather than probing (and failing to open) each '.dcx' variant in turn. Names are
+        # matched case-insensitively, as Windows would when opening them.
+        available_file_names = {f.name.lower(): f.name for f in os.scandir(self._draw_param_directory) if f.is_file()}
         for area_id in self._MAP_IDS:
             if isinstance(area_id, int):
                 file_map_name = f"a{area_id}"
@@ -400,20 +555,17 @@ class DarkSoulsLightingParameters:
             else:
                 file_map_name = map_name = area_id
             file_map_name += "_DrawParam.parambnd"
+            for bnd_file_name in (f"{file_map_name}.dcx", file_map_name):
+                if bnd_file_name.lower() in available_file_names:
+                    self._bnd_file_names[map_name] = available_file_names[bnd_file_name.lower()]
+                    break
+            else:
+                raise FileNotFoundError(
+                    f"Could not find '{file_map_name}[.dcx]' in directory " f"'{self._draw_param_directory}'."
+                )
 
-            try:
-                draw_param_bnd = BND(self._draw_param_directory / f"{file_map_name}.dcx", optional_dcx=False)
-                file_map_name += ".dcx"
-            except FileNotFoundError:
-                try:
-                    draw_param_bnd = BND(self._draw_param_directory / file_map_name, optional_dcx=False)
-                except FileNotFoundError:
-                    raise FileNotFoundError(
-                        f"Could not find '{file_map_name}[.dcx]' in directory " f"'{self._draw_param_directory}'."
-                    )
-            self._data[map_name] = MapDrawParam(draw_param_bnd)
-            self._bnd_file_names[map_name] = file_map_name
-            setattr(self, map_name, self._data[map_name])
+        for map_name, bnd_file_name in self._bnd_file_names.items():
+            self._data[map_name] = MapDrawParam(BND(self._draw_param_directory / bnd_file_name, optional_dcx=False))
 
     def __getitem__(self, map_name):
         if map_name not in self._data:
@@ -425,8 +577,12 @@ class DarkSoulsLightingParameters:
 
     def pickle(self, lighting_param_pickle_path):
         """Save the entire `DarkSoulsLightingParameters` instance to a pickled file, which will be faster to load."""
-        with Path(lighting_param_pickle_path).open("wb") as f:
-            pickle.dump(self, f)
+        _write_pickle(self, lighting_param_pickle_path)
+
+    @classmethod
+    def load_pickle(cls, lighting_param_pickle_path) -> DarkSoulsLightingParameters:
+        """Load a `DarkSoulsLightingParameters` instance previously saved with `pickle()`."""
+        return _read_pickle(cls, lighting_param_pickle_path)
 
     def save(self, draw_param_directory=None):
         if not draw_param_directory:
@@ -4,10 +4,12 @@ __all__ = ["ParamDefBND", "ParamDefField", "ParamDef", "PARAMDEF_BASE_NAMES"]
 
 import io
 import logging
+import struct
 import typing as tp
 from pathlib import Path
 
 from soulstruct.bnd import BND3, BNDEntry
+from soulstruct.params import enums
 from soulstruct.params.display_info import get_param_info, get_param_info_field
 from soulstruct.utilities.core import BinaryStruct, read_chars_from_bytes, PACKAGE_PATH
 
@@ -110,6 +112,17 @@ class ParamDefField:
 
         self.bit_size = self.get_bit_size(self.name, self.internal_type, self.size)
 
+        # Resolved from `internal_type` by `ParamDef` when it is loaded. None for bit fields and pad fields.
+        self.field_type = None
+        self.python_type = None
+        self.value_range = None  # type: tp.Optional[tp.Tuple[tp.Union[int, float], tp.Union[int, float]]]
+
+    def set_field_type(self, field_type):
+        """Set the field type (from `params.enums`) that this field is packed as, along with its valid values."""
+        self.field_type = field_type
+        self.python_type = field_type.python_type()
+        self.value_range = (field_type.minimum(), field_type.maximum())
+
     def get_display_info(self, entry: ParamEntry):
         if not self._display_info:
             raise ValueError(f"No display information given for field '{self.name}'.")
@@ -173,6 +186,14 @@ class ParamDef:
         ("relative_field_description_offset", "h", 104),
     )
 
+    _field_names = None  # type: tp.Optional[tp.Tuple[str, ...]]
+
+    # Built on first use by `entry_struct`, `entry_layout`, `entry_unpacker`, and `entry_packer`, and never pickled.
+    _entry_struct = None  # type: tp.Optional[struct.Struct]
+    _entry_layout = None  # type: tp.Optional[tuple]
+    _entry_unpacker = None  # type: tp.Optional[tp.Callable[[tuple], tp.Optional[dict]]]
+    _entry_packer = None  # type: tp.Optional[tp.Callable[[dict], tp.Optional[bytes]]]
+
     def __init__(self, paramdef_source, param_name=None):
 
         self.param_name = None
@@ -208,6 +229,8 @@ class ParamDef:
             # This param has no extra information.
             self.param_info = None
 
+        self._resolve_field_types()
+
     def unpack(self, paramdef_buffer):
         """Convert a paramdef file to a dictionary, indexed by ID."""
         header = self.HEADER_STRUCT.unpack(paramdef_buffer)
@@ -225,6 +248,191 @@ class ParamDef:
             raise AttributeError(f"Field {field_name} does not exist in ParamDef.")
         return hits[0]
 
+    @property
+    def field_names(self) -> tuple:
+        """Names of all fields, in order."""
+        if self._field_names is None:
+            self._field_names = tuple(field.name for field in self.fields)
+        return self._field_names
+
+    def _resolve_field_types(self):
+        for field in self.fields:
+            if field.bit_size >= 8 and field.internal_type != "dummy8":
+                field.set_field_type(self.get_field_type(field))
+
+    def get_field_type(self, field: ParamDefField):
+        """Get the field type class (from `params.enums`) that the given non-pad field is packed as."""
+        try:
+            return getattr(enums, field.internal_type)
+        except AttributeError:
+            if field.name == "sfxMultiplier":
+                return enums.f32
+            raise KeyError(
+                f"Field {field.name} in ParamTable {self.param_name} has unknown internal type {field.internal_type} "
+                f"(debug type = {field.debug_type})."
+            )
+
+    @property
+    def entry_struct(self) -> struct.Struct:
+        """Single `struct.Struct` that unpacks (or packs) every field of an entry in one call.
+
+        Each run of bit field bytes is read as one or more "I", "H", or "B" values and pad fields are raw bytes. Use
+        `entry_layout` to map the values onto fields.
+        """
+        if self._entry_struct is None:
+            self._build_entry_struct()
+        return self._entry_struct
+
+    @property
+    def entry_layout(self) -> tuple:
+        """Tuple of `(field, field_type, value_index, bit_offset, bit_mask, end_offset)` for each field, in order.
+
+        `field_type` is None for pad fields and bit fields, `bit_offset` and `bit_mask` are None for non-bit fields, and
+        `end_offset` is the offset of the first byte after the field (for entries that are shorter than `entry_struct`).
+        Consecutive bytes of bit fields are combined into as few values as possible, so `bit_offset` can exceed 7.
+        """
+        if self._entry_layout is None:
+            self._build_entry_struct()
+        return self._entry_layout
+
+    @property
+    def entry_unpacker(self) -> tp.Callable[[tuple], tp.Optional[dict]]:
+        """Function generated for this ParamDef that converts `entry_struct` values to a new dictionary of fields.
+
+        Returns None if any pad field is not null.
+        """
+        if self._entry_unpacker is None:
+            self._build_entry_codecs()
+        return self._entry_unpacker
+
+    @property
+    def entry_packer(self) -> tp.Callable[[dict], tp.Optional[bytes]]:
+        """Function generated for this ParamDef that packs a dictionary of fields with `entry_struct`.
+
+        Returns None if any field has an invalid type or value (rather than working out which one).
+        """
+        if self._entry_packer is None:
+            self._build_entry_codecs()
+        return self._entry_packer
+
+    def _build_entry_struct(self):
+        entry_format = "<"
+        layout = []
+        value_index = -1
+        offset = 0
+        bit_run = []  # `(field, byte_index, bit_offset)` for consecutive bit fields
+
+        def add_bit_run():
+            # Read each run of bit bytes as as few "I", "H", and "B" values as possible.
+            nonlocal entry_format, value_index, offset
+            if not bit_run:
+                return
+            run_size = bit_run[-1][1] + 1
+            run_values = []  # `(value_index, first_byte_index)` for each byte
+            byte_index = 0
+            while byte_index < run_size:
+                value_size = 4 if run_size - byte_index >= 4 else 2 if run_size - byte_index >= 2 else 1
+                entry_format += {4: "I", 2: "H", 1: "B"}[value_size]
+                value_index += 1
+                run_values += [(value_index, byte_index)] * value_size
+                byte_index += value_size
+            for bit_field, byte_index, bit_offset in bit_run:
+                bit_value_index, first_byte_index = run_values[byte_index]
+                bit_offset += 8 * (byte_index - first_byte_index)
+                bit_mask = (1 << bit_field.bit_size) - 1
+                layout.append((bit_field, None, bit_value_index, bit_offset, bit_mask, offset + byte_index + 1))
+            offset += run_size
+            bit_run.clear()
+
+        for field in self.fields:
+            if field.bit_size < 8:
+                if not bit_run:
+                    bit_run.append((field, 0, 0))
+                else:
+                    _, byte_index, bit_offset = bit_run[-1]
+                    bit_offset += bit_run[-1][0].bit_size
+                    if bit_offset + field.bit_size > 8:
+                        # Start a new bit byte.
+                        byte_index += 1
+                        bit_offset = 0
+                    bit_run.append((field, byte_index, bit_offset))
+                continue
+            add_bit_run()  # any unused bits of the last bit byte are skipped
+            value_index += 1
+            if field.internal_type == "dummy8":
+                field_type = None
+                entry_format += f"{field.size}s"
+                offset += field.size
+            else:
+                field_type = field.field_type
+                entry_format += field_type.format().lstrip("<")
+                offset += field_type.size()
+            layout.append((field, field_type, value_index, None, None, offset))
+        add_bit_run()
+        self._entry_struct = struct.Struct(entry_format)
+        self._entry_layout = tuple(layout)
+
+    def _build_entry_codecs(self):
+        """Generate and compile `entry_unpacker` and `entry_packer`, with every field index, bit shift, and name written
+        out, so that no field layout is interpreted per entry."""
+        namespace = {"struct": struct, "entry_struct_pack": self.entry_struct.pack}
+        pad_checks = []
+        unpacked_items = []
+        packer_lines = []
+        packer_checks = []
+        packed_values = {}  # type: tp.Dict[int, tp.List[str]]
+
+        for i, (field, field_type, value_index, bit_offset, bit_mask, _) in enumerate(self.entry_layout):
+            if bit_offset is not None:
+                unpacked_items.append(f"{field.name!r}: v[{value_index}] >> {bit_offset} & {bit_mask},")
+                packer_lines.append(f"x{i} = f[{field.name!r}]")
+                packer_checks.append(f"x{i} & {~bit_mask}")
+                packed_values.setdefault(value_index, []).append(f"x{i} << {bit_offset}")
+            elif field_type is None:
+                unpacked_items.append(f"{field.name!r}: v[{value_index}],")
+                pad_checks.append(f"v[{value_index}] != {bytes(field.size)!r}")
+                packed_values[value_index] = ['b""']  # padded with nulls
+            else:
+                unpacked_items.append(f"{field.name!r}: v[{value_index}],")
+                packer_lines.append(f"x{i} = f[{field.name!r}]")
+                if field.python_type is float:
+                    # `struct` checks the type and range of integers, but would accept ints (and NaN) for floats.
+                    namespace[f"min{i}"], namespace[f"max{i}"] = field.value_range
+                    packer_checks.append(f"not (isinstance(x{i}, float) and min{i} <= x{i} <= max{i})")
+                packed_values[value_index] = [f"x{i}"]
+
+        unpacker_source = "def entry_unpacker(v):\n"
+        if pad_checks:
+            unpacker_source += f"    if {' or '.join(pad_checks)}:\n        return None\n"
+        unpacker_source += "    return {\n" + "".join(f"        {item}\n" for item in unpacked_items) + "    }\n"
+
+        packer_source = "def entry_packer(f):\n" + "".join(f"    {line}\n" for line in packer_lines)
+        if packer_checks:
+            packer_source += f"    if {' or '.join(packer_checks)}:\n        return None\n"
+        packed_args = ", ".join(" | ".join(packed_values[j]) for j in sorted(packed_values))
+        packer_source += (
+            "    try:\n"
+            f"        return entry_struct_pack({packed_args})\n"
+            "    except struct.error:\n"
+            "        return None\n"
+        )
+
+        exec(compile(unpacker_source + packer_source, f"<{self.param_name} entry codecs>", "exec"), namespace)
+        self._entry_unpacker = namespace["entry_unpacker"]
+        self._entry_packer = namespace["entry_packer"]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_entry_struct", None)  # `struct.Struct` cannot be pickled
+        state.pop("_entry_layout", None)
+        state.pop("_entry_unpacker", None)  # generated functions cannot be pickled
+        state.pop("_entry_packer", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._resolve_field_types()  # fields pickled before types were resolved on load don't have them
+
     def __repr__(self):
         return f"ParamDef {self.param_name}:\n  " + "\n  ".join(
             [f"{field.index} | {field.debug_name} | {field.description}" for field in self.fields]
@@ -177,7 +177,7 @@ class SoulstructLightingEditor(SoulstructBaseFieldEditor):
                 raise ValueError("No param category selected.")
         if entry_id not in self.get_category_data(category).entries:
             raise ValueError(f"Param ID {entry_id} does not appear in category {category}.")
-        return sorted(self.get_category_data(category).entries).index(entry_id)
+        return self.get_category_data(category).get_sorted_ids().index(entry_id)
 
     def get_entry_text(self, entry_id: int, category=None) -> str:
         if category is None:
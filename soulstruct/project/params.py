@@ -9,7 +9,7 @@ from soulstruct.project.base.field_editor import SoulstructBaseFieldEditor
 from soulstruct.project.utilities import NameSelectionBox
 
 if tp.TYPE_CHECKING:
-    from soulstruct.params import DarkSoulsGameParameters, ParamEntry
+    from soulstruct.params import DarkSoulsGameParameters, ParamEntry, ParamTable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -187,12 +187,13 @@ class SoulstructParamsEditor(SoulstructBaseFieldEditor):
     def _get_display_categories(self):
         return self.Params.param_names
 
-    def get_category_data(self, category=None):
+    def get_category_data(self, category=None) -> tp.Union[ParamTable, dict]:
+        """Entries are added and removed through the `ParamTable`, so it knows to repack itself."""
         if category is None:
             category = self.active_category
             if category is None:
                 return {}
-        return self.Params[category].entries
+        return self.Params[category]
 
     def _get_category_name_range(self, category=None, first_index=None, last_index=None) -> list:
         if category is None:
@@ -209,7 +210,7 @@ class SoulstructParamsEditor(SoulstructBaseFieldEditor):
                 raise ValueError("No param category selected.")
         if entry_id not in self.Params[category].entries:
             raise ValueError(f"Param ID {entry_id} does not appear in category {category}.")
-        return sorted(self.Params[category].entries).index(entry_id)
+        return self.Params[category].get_sorted_ids().index(entry_id)
 
     def get_entry_text(self, entry_id: int, category=None) -> str:
         if category is None:
@@ -0,0 +1,183 @@
+import random
+import re
+import struct
+
+import pytest
+
+from soulstruct.bnd import BND, BNDEntry
+from soulstruct.params import DarkSoulsGameParameters
+from soulstruct.params.core import JUNK_ENTRY_NAMES, ParamEntry, ParamTable, PARAMDEF_BND
+from soulstruct.utilities.core import PACKAGE_PATH
+
+_F32 = struct.Struct("<f")
+
+
+def _random_entry_data(paramdef, rng: random.Random) -> bytes:
+    """Pack random valid values for every field of `paramdef` (with null pads)."""
+    values = []
+    for field, field_type, value_index, bit_offset, bit_mask, _ in paramdef.entry_layout:
+        if bit_offset is not None:
+            if value_index == len(values):
+                values.append(0)
+            values[value_index] |= rng.randint(0, bit_mask) << bit_offset
+        elif field_type is None:
+            values.append(b"")
+        elif field.python_type is float:
+            values.append(_F32.unpack(_F32.pack(rng.uniform(-1e4, 1e4)))[0])
+        else:
+            values.append(rng.randint(*field.value_range))
+    return paramdef.entry_struct.pack(*values)
+
+
+def _pack_param_table(param_name: str, entries, share_names=False) -> bytes:
+    """Pack `.param` data from `(entry_id, entry_data, raw_name)` tuples, independently of `ParamTable.pack()`.
+
+    Equal names are written once and share an offset if `share_names` is True.
+    """
+    entry_data_offset = ParamTable.HEADER_STRUCT.size + ParamTable.ENTRY_POINTER_PACKER.size * len(entries)
+    name_data_offset = entry_data_offset + sum(len(entry_data) for _, entry_data, _ in entries)
+    entry_pointers = []
+    packed_names = []
+    name_offsets = {}
+    data_offset = entry_data_offset
+    name_offset = name_data_offset
+    for entry_id, entry_data, raw_name in entries:
+        if not share_names or raw_name not in name_offsets:
+            name_offsets[raw_name] = name_offset
+            packed_names.append(raw_name + b"\0")
+            name_offset += len(raw_name) + 1
+        entry_pointers.append(ParamTable.ENTRY_POINTER_PACKER.pack(entry_id, data_offset, name_offsets[raw_name]))
+        data_offset += len(entry_data)
+    header = ParamTable.HEADER_STRUCT.pack(
+        dict(
+            name_data_offset=name_data_offset,
+            entry_data_offset=min(entry_data_offset, 2 ** 16 - 1),
+            magic0=0,
+            magic1=1,
+            entry_count=len(entries),
+            param_name=param_name,
+            magic2=2,
+            unknown=0,
+        )
+    )
+    return b"".join([header, *entry_pointers, *(entry_data for _, entry_data, _ in entries), *packed_names])
+
+
+def test_entry_fields_edits_are_packed():
+    paramdef = PARAMDEF_BND("dsr")["EQUIP_PARAM_WEAPON_ST"]
+    entry_data = bytes(paramdef.entry_struct.size)
+    entry = ParamEntry(entry_data, paramdef, name="Test")
+    field_name = next(field.name for field in paramdef.fields if field.python_type is int)
+    assert entry.pack() == entry_data
+
+    with pytest.raises(TypeError):
+        entry.fields[field_name] = 1  # would not be packed
+    assert entry.fields[field_name] == 0
+    assert entry.pack() == entry_data
+
+    entry[field_name] = 1
+    assert entry.fields[field_name] == 1
+    assert entry.pack() != entry_data
+    assert ParamEntry(entry.pack(), paramdef, name="Test")[field_name] == 1
+
+
+def test_entry_dict_must_match_paramdef():
+    paramdef = PARAMDEF_BND("dsr")["EQUIP_PARAM_WEAPON_ST"]
+    fields = dict(ParamEntry(bytes(paramdef.entry_struct.size), paramdef, name="Test").fields)
+    missing_field_name = next(iter(fields))
+    with pytest.raises(ValueError, match=re.escape(missing_field_name)):
+        ParamEntry({"name": "Test", **{k: v for k, v in fields.items() if k != missing_field_name}}, paramdef)
+    with pytest.raises(ValueError, match="notAField"):
+        ParamEntry({"name": "Test", **fields, "notAField": 0}, paramdef)
+    assert list(ParamEntry({**dict(reversed(fields.items())), "name": "Test"}, paramdef).fields) == list(fields)
+
+
+@pytest.mark.parametrize("game_version", ["ptde", "dsr"])
+def test_bundled_paramdefs_round_trip(game_version):
+    rng = random.Random(game_version)
+    paramdef_bnd = PARAMDEF_BND(game_version)
+    for param_name, paramdef in paramdef_bnd.paramdefs.items():
+        entries = [(entry_id, _random_entry_data(paramdef, rng), f"Entry {entry_id}".encode()) for entry_id in range(5)]
+        for _, entry_data, _ in entries:
+            entry = ParamEntry(entry_data, paramdef, name="Test")
+            assert entry.pack() == entry_data, param_name
+            assert ParamEntry({"name": "Test", **entry.fields}, paramdef).pack() == entry_data, param_name
+        param_data = _pack_param_table(param_name, entries)
+        assert ParamTable(param_data, paramdef_bnd).pack() == param_data, param_name
+
+        pad_ends = [
+            (field, end_offset)
+            for field, field_type, _, bit_offset, _, end_offset in paramdef.entry_layout
+            if field_type is None and bit_offset is None
+        ]
+        if pad_ends:
+            pad_field, end_offset = pad_ends[0]
+            bad_entry_data = bytearray(entries[0][1])
+            bad_entry_data[end_offset - pad_field.size] = 1
+            with pytest.raises(ValueError):
+                ParamEntry(bytes(bad_entry_data), paramdef, name="Test")
+
+
+@pytest.mark.parametrize("param_name", ["TONE_MAP_BANK", "TONE_CORRECT_BANK"])
+def test_short_dsr_tone_entries(param_name):
+    """Some DSR ToneMapBank and ToneCorrectBank tables omit their last float field, which is read as 1.0."""
+    paramdef_bnd = PARAMDEF_BND("dsr")
+    paramdef = paramdef_bnd[param_name]
+    rng = random.Random(param_name)
+    full_entries = []
+    for entry_id in range(3):
+        entry_data = _random_entry_data(paramdef, rng)
+        full_entries.append((entry_id, entry_data[:-4] + _F32.pack(1.0), b"Test"))
+    short_entries = [(entry_id, entry_data[:-4], raw_name) for entry_id, entry_data, raw_name in full_entries]
+
+    param_table = ParamTable(_pack_param_table(param_name, short_entries), paramdef_bnd)
+    assert all(entry[paramdef.fields[-1].name] == 1.0 for entry in param_table.values())
+    assert param_table.pack() == _pack_param_table(param_name, full_entries)
+
+
+def test_entry_names():
+    paramdef_bnd = PARAMDEF_BND("dsr")
+    paramdef = paramdef_bnd["EQUIP_PARAM_WEAPON_ST"]
+    entry_data = bytes(paramdef.entry_struct.size)
+    junk_0, junk_1 = JUNK_ENTRY_NAMES
+    names = ["Dagger", "", "ダガー", "Dagger", junk_0, "ダガー", junk_1, junk_0]
+    raw_names = [name if isinstance(name, bytes) else name.encode("shift_jis_2004") for name in names]
+    entries = [(entry_id, entry_data, raw_name) for entry_id, raw_name in enumerate(raw_names)]
+    param_data = _pack_param_table("EQUIP_PARAM_WEAPON_ST", entries)
+
+    for share_names in (False, True):
+        param_table = ParamTable(_pack_param_table("EQUIP_PARAM_WEAPON_ST", entries, share_names), paramdef_bnd)
+        assert [entry.name for entry in param_table.values()] == names
+        assert param_table.pack() == param_data  # names are always packed separately
+
+
+def test_sorted_ids_follow_direct_edits():
+    paramdef_bnd = PARAMDEF_BND("dsr")
+    paramdef = paramdef_bnd["EQUIP_PARAM_WEAPON_ST"]
+    rng = random.Random("sort")
+    entries = [(entry_id, _random_entry_data(paramdef, rng), b"Weapon") for entry_id in range(5)]
+    param_table = ParamTable(_pack_param_table("EQUIP_PARAM_WEAPON_ST", entries), paramdef_bnd)
+    assert [entry_id for entry_id, _ in param_table.get_range(0, 10)] == [0, 1, 2, 3, 4]
+
+    param_table.entries[10] = param_table.entries.pop(0)  # same number of entries, and now out of order
+    assert [entry_id for entry_id, _ in param_table.get_range(0, 10)] == [1, 2, 3, 4, 10]
+    assert list(ParamTable(param_table.pack(), paramdef_bnd)) == [1, 2, 3, 4, 10]
+
+
+def test_deleted_entry_is_saved(tmp_path):
+    paramdef = PARAMDEF_BND("ptde")["EQUIP_PARAM_WEAPON_ST"]
+    rng = random.Random("delete")
+    entries = [(entry_id, _random_entry_data(paramdef, rng), b"Weapon") for entry_id in range(3)]
+    game_param_bnd = BND(PACKAGE_PATH("params/resources/paramdef.paramdefbnd"))  # any PTDE BND3 as a template
+    game_param_bnd.clear_entries()
+    game_param_bnd.add_entry(
+        BNDEntry(
+            _pack_param_table("EQUIP_PARAM_WEAPON_ST", entries),
+            entry_id=0,
+            path="N:\\FRPG\\data\\INTERROOT_win32\\param\\GameParam\\EquipParamWeapon.param",
+        )
+    )
+    game_params = DarkSoulsGameParameters(game_param_bnd)
+    game_params.Weapons.pop(1)
+    game_params.save(tmp_path)
+    assert list(DarkSoulsGameParameters(tmp_path).Weapons) == [0, 2]